@@ -14,20 +14,36 @@ import json
 import logging
 import math
 import os
-import struct
 import time
 from collections import defaultdict
-from datetime import datetime
+from functools import lru_cache
 from uuid import getnode as get_mac
 
 import cv2
 import ntplib
 import numpy as np
 import paho.mqtt.client as mqtt
-from pytz import timezone
 
 from utils import publisher_utils as utils
 
+# libjpeg-turbo bindings are optional, fall back to cv2.imencode when unavailable
+try:
+  from turbojpeg import TJPF_BGR, TJPF_BGRX, TJSAMP_420, TurboJPEG
+  TURBOJPEG = TurboJPEG()
+except Exception:
+  TURBOJPEG = None
+JPEG_QUALITY = 95
+
+# orjson is optional as well, both variants return utf-8 encoded bytes
+try:
+  import orjson
+
+  def jsonDumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+  def jsonDumps(obj):
+    return json.dumps(obj).encode('utf-8')
+
 # --- CameraIntrinsics class (from transform.py, simplified for local use) ---
 class CameraIntrinsics:
   INTRINSICS_KEYS = ('fx', 'fy', 'cx', 'cy')
@@ -35,6 +51,17 @@ class CameraIntrinsics:
                     's1', 's2', 's3', 's4', 'taux', 'tauy')
 
   def __init__(self, intrinsics, distortion=None, resolution=None):
+    # Fast path for the common case of a plain fx/fy/cx/cy dict
+    if isinstance(intrinsics, dict) and len(intrinsics) == 4 \
+       and all(k in intrinsics for k in self.INTRINSICS_KEYS):
+      self.intrinsics = np.array([
+        [intrinsics['fx'], 0.0, intrinsics['cx']],
+        [0.0, intrinsics['fy'], intrinsics['cy']],
+        [0.0, 0.0, 1.0]
+      ], dtype=np.float64)
+      self._setDistortion(distortion)
+      return
+
     # If dict, convert to list
     if isinstance(intrinsics, dict):
       intrinsics_list = self.intrinsicsDictToList(intrinsics)
@@ -92,6 +119,7 @@ class CameraIntrinsics:
       distortion = np.zeros(14)
 
     self.distortion = distortion
+    self._dict = None
 
   def computeIntrinsicsFromFoV(self, resolution, fov):
     if not isinstance(resolution, (list, tuple)) or len(resolution) != 2:
@@ -127,33 +155,74 @@ class CameraIntrinsics:
     return dList
 
   def asDict(self):
-    return {
-      'intrinsics': {
-        'fx': self.intrinsics[0][0],
-        'fy': self.intrinsics[1][1],
-        'cx': self.intrinsics[0][2],
-        'cy': self.intrinsics[1][2],
-      },
-      'distortion': dict(zip(self.DISTORTION_KEYS, self.distortion)),
-    }
+    # intrinsics and distortion don't change once set, so build the dict only once
+    if self._dict is None:
+      self._dict = {
+        'intrinsics': {
+          'fx': float(self.intrinsics[0][0]),
+          'fy': float(self.intrinsics[1][1]),
+          'cx': float(self.intrinsics[0][2]),
+          'cy': float(self.intrinsics[1][2]),
+        },
+        'distortion': dict(zip(self.DISTORTION_KEYS, self.distortion.tolist())),
+      }
+    return self._dict
 
 ROOT_CA = os.environ.get('ROOT_CA', '/run/secrets/certs/scenescape-ca.pem')
-DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
-TIMEZONE = "UTC"
-
+TIMESTAMP_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d"
+
+class TimestampFormatter:
+  # ISO-8601 UTC with millisecond precision, e.g. 2024-01-01T00:00:00.000Z
+  # Successive timestamps from one source mostly fall in the same second, so the
+  # formatted date/time of the last second is kept and only the ms get formatted.
+  # Use one instance per source: buildObjData formats both the (possibly NTP
+  # adjusted) post-decode time and the local end time, which can sit in
+  # different seconds and would otherwise evict each other on every frame.
+  def __init__(self):
+    self._sec = None
+    self._prefix = None
+
+  def format(self, now):
+    # round to whole microseconds first like datetime.fromtimestamp, then truncate to ms
+    sec = math.floor(now)
+    us = round((now - sec) * 1e6)
+    sec, us = sec + us // 1000000, us % 1000000
+    if sec != self._sec:
+      self._prefix = TIMESTAMP_FORMAT % time.gmtime(sec)[:6]
+      self._sec = sec
+    return "%s.%03dZ" % (self._prefix, us // 1000)
+
+def encodeJPEG(image):
+  # turbojpeg only handles 3/4 channel frames, anything else goes through cv2;
+  # 4:2:0 subsampling matches what cv2.imencode produces
+  if TURBOJPEG is not None and image.ndim == 3 and image.shape[2] in (3, 4):
+    pixel_format = TJPF_BGRX if image.shape[2] == 4 else TJPF_BGR
+    return TURBOJPEG.encode(image, quality=JPEG_QUALITY, pixel_format=pixel_format,
+                            jpeg_subsample=TJSAMP_420)
+  _, jpeg = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+  return jpeg
+
+def dumpsImgData(imgdatadict):
+  # base64 output is plain ascii, so splice the encoded image in as bytes rather
+  # than having the json encoder scan and escape a multi-megabyte string
+  meta = {k: v for k, v in imgdatadict.items() if k != 'image'}
+  head = jsonDumps(meta)[:-1] + (b',' if meta else b'')
+  return head + b'"image": "' + imgdatadict['image'] + b'"}'
+
+@lru_cache(maxsize=None)
 def getMACAddress():
+  # the address doesn't change during the lifetime of the process
   if 'MACADDR' in os.environ:
     return os.environ['MACADDR']
 
-  a = get_mac()
-  h = iter(hex(a)[2:].zfill(12))
-  return ":".join(i + next(h) for i in h)
+  a = "%012x" % get_mac()
+  return ":".join(a[i:i + 2] for i in range(0, 12, 2))
 
 class PostDecodeTimestampCapture:
   def __init__(self, ntpServer=None):
     self.log = logging.getLogger('SSCAPE_ADAPTER')
     self.log.setLevel(logging.INFO)
-    self.ntpClient = ntplib.NTPClient()
+    self.ntpClient = ntplib.NTPClient() if ntpServer else None
     self.ntpServer = ntpServer
     self.lastTimeSync = None
     self.timeOffset = 0
@@ -164,9 +233,11 @@ class PostDecodeTimestampCapture:
     self.last_calculated_fps_ts = None
     self.fps_calc_interval = 1 # calculate fps every 1s
     self.frame_cnt = 0
+    # ntpServer is fixed for the lifetime of the pipeline, so pick the
+    # per-frame handler once instead of testing it on every frame
+    self.processFrame = self._processFrameNTP if ntpServer else self._processFrameLocal
 
-  def processFrame(self, frame):
-    now = time.time()
+  def _updateFPS(self, now):
     self.frame_cnt += 1
     if not self.last_calculated_fps_ts:
       self.last_calculated_fps_ts = now
@@ -174,54 +245,63 @@ class PostDecodeTimestampCapture:
       self.fps = self.fps * self.fps_alpha + (1 - self.fps_alpha) * (self.frame_cnt / (now - self.last_calculated_fps_ts))
       self.last_calculated_fps_ts = now
       self.frame_cnt = 0
+    return
 
-    if self.ntpServer:
-      # if ntpServer is available, check if it is time to recalibrate
-      if not self.lastTimeSync or now - self.lastTimeSync > 1000 :
-        response = self.ntpClient.request(host=self.ntpServer, port=123)
-        self.timeOffset = response.offset
-        self.lastTimeSync = now
+  def _processFrameLocal(self, frame):
+    now = time.time()
+    self._updateFPS(now)
+    return self._addTimestamp(frame, now)
 
-    now += self.timeOffset
+  def _processFrameNTP(self, frame):
+    now = time.time()
+    self._updateFPS(now)
+    # check if it is time to recalibrate against the ntp server
+    if not self.lastTimeSync or now - self.lastTimeSync > 1000 :
+      response = self.ntpClient.request(host=self.ntpServer, port=123)
+      self.timeOffset = response.offset
+      self.lastTimeSync = now
+    return self._addTimestamp(frame, now + self.timeOffset)
+
+  def _addTimestamp(self, frame, now):
     self.timestamp_for_next_block = now
-    frame.add_message(json.dumps({
-      'postdecode_timestamp': f"{datetime.fromtimestamp(now, tz=timezone(TIMEZONE)).strftime(DATETIME_FORMAT)[:-3]}Z",
+    # only the raw float is passed on, PostInferenceDataPublish formats it
+    frame.add_message(jsonDumps({
       'timestamp_for_next_block': now,
       'fps': self.fps
-    }))
+    }).decode('utf-8'))
     return True
 
-def computeObjBoundingBoxParams(pobj, fw, fh, x, y, w, h, xminnorm=None, yminnorm=None, xmaxnorm=None, ymaxnorm=None):
-  # use normalized bounding box for calculating center of mass
-  xmax, xmin = int(xmaxnorm * fw), int(xminnorm * fw)
-  ymax, ymin = int(ymaxnorm * fh), int(yminnorm * fh)
+BOUNDING_BOX_KEYS = ('x_min', 'y_min', 'x_max', 'y_max')
+
+def computeObjBoundingBoxParams(items, fw, fh):
+  # use normalized bounding boxes for calculating center of mass, all objects of a frame at once
+  if not items:
+    return []
+  bboxes = np.array([[item['detection']['bounding_box'][k] for k in BOUNDING_BOX_KEYS] for item in items],
+                    dtype=np.float64)
+  xmin, ymin, xmax, ymax = (bboxes * (fw, fh, fw, fh)).astype(np.int64).T
   comw, comh = (xmax - xmin) / 3, (ymax - ymin) / 4
+  comx, comy = (xmin + comw).astype(np.int64), (ymin + comh).astype(np.int64)
 
-  pobj.update({
-    'center_of_mass': {'x': int(xmin + comw), 'y': int(ymin + comh), 'width': comw, 'height': comh},
-    'bounding_box_px': {'x': x, 'y': y, 'width': w, 'height': h}
-  })
-
-  return
+  return [{
+    'center_of_mass': {'x': x, 'y': y, 'width': w, 'height': h},
+    'bounding_box_px': {'x': item['x'], 'y': item['y'], 'width': item['w'], 'height': item['h']}
+  } for item, x, y, w, h in zip(items, comx.tolist(), comy.tolist(), comw.tolist(), comh.tolist())]
 
 def detectionPolicy(pobj, item, fw, fh):
   pobj.update({
     'category': item['detection']['label'],
     'confidence': item['detection']['confidence']
   })
-  computeObjBoundingBoxParams(pobj, fw, fh, item['x'], item['y'], item['w'], item['h'],
-                              item['detection']['bounding_box']['x_min'],
-                              item['detection']['bounding_box']['y_min'],
-                              item['detection']['bounding_box']['x_max'],
-                              item['detection']['bounding_box']['y_max'])
+  # bounding box params are computed for the whole frame in buildObjData
   return
 
 def reidPolicy(pobj, item, fw, fh):
   detectionPolicy(pobj, item, fw, fh)
   reid_vector = item['tensors'][1]['data']
-  # following code snippet is from percebro/modelchain.py
-  v = struct.pack("256f",*reid_vector)
-  pobj['reid'] = base64.b64encode(v).decode('utf-8')
+  # pack as little-endian float32 in one pass (same layout as percebro/modelchain.py)
+  v = np.asarray(reid_vector, dtype='<f4')
+  pobj['reid'] = base64.b64encode(v.tobytes()).decode('ascii')
   return
 
 def classificationPolicy(pobj, item, fw, fh):
@@ -236,74 +316,94 @@ metadatapolicies = {
   "classificationPolicy": classificationPolicy
 }
 
-# Load camera calibration config once at module level
+# Parsed config files keyed by path, reparsed only when the file's mtime changes
+_JSON_CACHE = {}
+
+def load_json_cached(path):
+  mtime = os.stat(path).st_mtime
+  cached = _JSON_CACHE.get(path)
+  if cached is None or cached[0] != mtime:
+    with open(path, 'r') as f:
+      cached = (mtime, json.load(f))
+    _JSON_CACHE[path] = cached
+  return cached[1]
+
 CALIBRATION_CONFIG_PATH = '/home/pipeline-server/calibrations.json'
-try:
-  with open(CALIBRATION_CONFIG_PATH, 'r') as f:
-    CAMERA_CALIBRATION = json.load(f)
-except Exception as e:
-  CAMERA_CALIBRATION = {}
-  print(f"Warning: Could not load calibration config: {e}")
+
+def load_camera_calibration():
+  try:
+    return load_json_cached(CALIBRATION_CONFIG_PATH)
+  except Exception as e:
+    print(f"Warning: Could not load calibration config: {e}")
+    return {}
 
 THRESHOLDS_PATH = "/home/pipeline-server/models/confidence_thresholds.json"
 
 def load_confidence_thresholds():
   try:
-    with open(THRESHOLDS_PATH, "r") as f:
-      thresholds = json.load(f)
-      if isinstance(thresholds, dict) and "default" in thresholds:
-        return thresholds
-      else:
-        return {"default": 0.5}
+    thresholds = load_json_cached(THRESHOLDS_PATH)
+    if isinstance(thresholds, dict) and "default" in thresholds:
+      return thresholds
+    else:
+      return {"default": 0.5}
   except Exception:
     return {"default": 0.5}
 
 class PostInferenceDataPublish:
+  OBJ_COLORS = ((0, 0, 255), (255, 128, 128), (207, 83, 294), (31, 156, 238))
+  # category -> index into OBJ_COLORS, anything else uses index 2
+  OBJ_COLOR_INDEX = {'person': 0, 'vehicle': 1, 'bicycle': 1}
+
   def __init__(self, cameraid, metadatagenpolicy='detectionPolicy', publish_image=False):
     self.cameraid = cameraid
+    self.topic_data = f"scenescape/data/camera/{cameraid}"
+    self.topic_image = f"scenescape/image/camera/{cameraid}"
+    self.topic_calibration_image = f"scenescape/image/calibration/camera/{cameraid}"
+    self.topic_cmd = f"scenescape/cmd/camera/{cameraid}"
     self.is_publish_image = publish_image
     self.is_publish_calibration_image = False
+    # tracked from the mqtt callbacks so processFrame doesn't query the client every frame
+    self._connected = False
     self.setupMQTT()
     self.metadatagenpolicy = metadatapolicies[metadatagenpolicy]
-    self.frame_level_data = {'id': cameraid, 'debug_mac': getMACAddress()}
+    # objects dict is reused across frames, buildObjData clears it every frame
+    self._objects = defaultdict(list)
+    self.frame_level_data = {'id': cameraid, 'debug_mac': getMACAddress(), 'objects': self._objects}
     # --- Camera intrinsics and distortion setup ---
-    calib = CAMERA_CALIBRATION.get(cameraid, {})
+    calib = load_camera_calibration().get(cameraid, {})
     intrinsics = calib.get('intrinsics')
     distortion = calib.get('distortion')
     self.intrinsics_obj = None
     self.resolution = None
     self._calib_intrinsics = intrinsics
     self._calib_distortion = distortion
+    self._intrinsics_json = None
+    self._distortion_json = None
+    self._fps_cache = None
+    self._postdecode_formatter = TimestampFormatter()
+    self._end_formatter = TimestampFormatter()
     # --- Confidence thresholds ---
     self.confidence_thresholds = load_confidence_thresholds()
+    self._default_threshold = self.confidence_thresholds["default"]
     return
 
   def get_threshold(self, obj_type):
-    return self.confidence_thresholds.get(obj_type, self.confidence_thresholds["default"])
+    return self.confidence_thresholds.get(obj_type, self._default_threshold)
 
   def detectionPolicy(self, pobj, item, fw, fh):
-    obj_type = item['detection']['label']
-    confidence = item['detection']['confidence']
-    threshold = self.get_threshold(obj_type)
-    if confidence < threshold:
-      return  # Skip low-confidence detections
+    # low-confidence detections are already dropped in buildObjData
     pobj.update({
-      'category': obj_type,
-      'confidence': confidence
+      'category': item['detection']['label'],
+      'confidence': item['detection']['confidence']
     })
-    computeObjBoundingBoxParams(pobj, fw, fh, item['x'], item['y'], item['w'], item['h'],
-                                item['detection']['bounding_box']['x_min'],
-                                item['detection']['bounding_box']['y_min'],
-                                item['detection']['bounding_box']['x_max'],
-                                item['detection']['bounding_box']['y_max'])
     return
 
   def reidPolicy(self, pobj, item, fw, fh):
     self.detectionPolicy(pobj, item, fw, fh)
     reid_vector = item['tensors'][1]['data']
-    # following code snippet is from percebro/modelchain.py
-    v = struct.pack("256f",*reid_vector)
-    pobj['reid'] = base64.b64encode(v).decode('utf-8')
+    # pack as little-endian float32 in one pass (same layout as percebro/modelchain.py)
+    v = np.asarray(reid_vector, dtype='<f4')
+    pobj['reid'] = base64.b64encode(v.tobytes()).decode('ascii')
     return
 
   def classificationPolicy(self, pobj, item, fw, fh):
@@ -314,16 +414,23 @@ class PostInferenceDataPublish:
 
   def on_connect(self, client, userdata, flags, rc):
     if rc == 0:
+      self._connected = True
       print(f"Connected to MQTT Broker {self.broker}")
-      self.client.subscribe(f"scenescape/cmd/camera/{self.cameraid}")
-      print(f"Subscribed to topic: scenescape/cmd/camera/{self.cameraid}")
+      self.client.subscribe(self.topic_cmd)
+      print(f"Subscribed to topic: {self.topic_cmd}")
     else:
+      self._connected = False
       print(f"Failed to connect, return code {rc}")
     return
 
+  def on_disconnect(self, client, userdata, rc):
+    self._connected = False
+    return
+
   def setupMQTT(self):
     self.client = mqtt.Client()
     self.client.on_connect = self.on_connect
+    self.client.on_disconnect = self.on_disconnect
     self.broker = "broker.scenescape.intel.com"
     self.client.on_message = self.handleCameraMessage
     if ROOT_CA and os.path.exists(ROOT_CA):
@@ -341,31 +448,41 @@ class PostInferenceDataPublish:
     return
 
   def annotateObjects(self, img):
-    objColors = ((0, 0, 255), (255, 128, 128), (207, 83, 294), (31, 156, 238))
+    # draw category by category, batching consecutive categories of the same color
+    # into one polylines call so overlapping boxes stack in category order
+    # (annotation of pose not supported)
+    runs = []
     for otype, objects in self.frame_level_data['objects'].items():
-      if otype == "person":
-        cindex = 0
-        # annotation of pose not supported
-        #self.annotateHPE(frame, obj)
-      elif otype == "vehicle" or otype == "bicycle":
-        cindex = 1
-      else:
-        cindex = 2
+      cindex = self.OBJ_COLOR_INDEX.get(otype, 2)
+      if not runs or runs[-1][0] != cindex:
+        runs.append((cindex, []))
+      boxes = runs[-1][1]
       for obj in objects:
-        topleft_cv = (int(obj['bounding_box_px']['x']), int(obj['bounding_box_px']['y']))
-        bottomright_cv = (int(obj['bounding_box_px']['x'] + obj['bounding_box_px']['width']),
-                          int(obj['bounding_box_px']['y'] + obj['bounding_box_px']['height']))
-        cv2.rectangle(img, topleft_cv, bottomright_cv, objColors[cindex], 4)
+        bbox = obj['bounding_box_px']
+        boxes.append((bbox['x'], bbox['y'], bbox['width'], bbox['height']))
+
+    for cindex, boxes in runs:
+      if not boxes:
+        continue
+      x, y, w, h = np.array(boxes, dtype=np.float64).T
+      x0, y0 = x.astype(np.int32), y.astype(np.int32)
+      x1, y1 = (x + w).astype(np.int32), (y + h).astype(np.int32)
+      corners = np.stack((x0, y0, x1, y0, x1, y1, x0, y1), axis=1).reshape(-1, 4, 2)
+      cv2.polylines(img, list(corners), True, self.OBJ_COLORS[cindex], 4)
     return
 
   def annotateFPS(self, img, fpsval):
     # code snippet is taken from annotateFPS method in percebro/videoframe.py
     fpsStr = f'FPS {fpsval:.1f}'
-    scale = int((img.shape[0] + 479) / 480)
-    cv2.putText(img, fpsStr, (0, 30 * scale), cv2.FONT_HERSHEY_SIMPLEX,
-                1 * scale, (0,0,0), 5 * scale)
-    cv2.putText(img, fpsStr, (0, 30 * scale), cv2.FONT_HERSHEY_SIMPLEX,
-                1 * scale, (255,255,255), 2 * scale)
+    # text placement only depends on the frame height, recompute only when it changes
+    if self._fps_cache is None or self._fps_cache[0] != img.shape[0]:
+      scale = int((img.shape[0] + 479) / 480)
+      self._fps_cache = (img.shape[0], (0, 30 * scale), 1 * scale, 5 * scale, 2 * scale)
+    _, origin, fontScale, outline, thickness = self._fps_cache
+    cv2.putText(img, fpsStr, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                fontScale, (0,0,0), outline)
+    cv2.putText(img, fpsStr, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                fontScale, (255,255,255), thickness)
     return
 
   def buildImgData(self, imgdatadict, gvaframe, annotate):
@@ -375,73 +492,92 @@ class PostInferenceDataPublish:
     })
     # Add intrinsics and distortion if available
     if self.intrinsics_obj is not None:
-      imgdatadict['intrinsics'] = self.intrinsics_obj.intrinsics.tolist()  # <-- publish as nested array
-      imgdatadict['distortion'] = dict(zip(self.intrinsics_obj.DISTORTION_KEYS, self.intrinsics_obj.distortion))
+      imgdatadict['intrinsics'] = self._intrinsics_json  # <-- publish as nested array
+      imgdatadict['distortion'] = self._distortion_json
     with gvaframe.data() as image:
       if annotate:
         self.annotateObjects(image)
         self.annotateFPS(image, self.frame_level_data['rate'])
-      _, jpeg = cv2.imencode(".jpg", image)
-    jpeg = base64.b64encode(jpeg).decode('utf-8')
-    imgdatadict['image'] = jpeg
+      jpeg = encodeJPEG(image)
+    # kept as ascii bytes, see dumpsImgData
+    imgdatadict['image'] = base64.b64encode(jpeg)
 
     return
 
   def buildObjData(self, gvadata):
     now = time.time()
+    postdecode_timestamp = float(gvadata['timestamp_for_next_block'])
     self.frame_level_data.update({
-      'timestamp': gvadata['postdecode_timestamp'],
-      'debug_timestamp_end': f"{datetime.fromtimestamp(now, tz=timezone(TIMEZONE)).strftime(DATETIME_FORMAT)[:-3]}Z",
-      'debug_processing_time': now - float(gvadata['timestamp_for_next_block']),
+      'timestamp': self._postdecode_formatter.format(postdecode_timestamp),
+      'debug_timestamp_end': self._end_formatter.format(now),
+      'debug_processing_time': now - postdecode_timestamp,
       'rate': float(gvadata['fps'])
     })
-    objects = defaultdict(list)
-    framewidth, frameheight = None, None
+    # --- Resolution is fixed per camera, only pick it up once ---
+    if self.resolution is None and 'resolution' in gvadata:
+      self.resolution = (gvadata['resolution']['width'], gvadata['resolution']['height'])
+
+    objects = self._objects
+    objects.clear()
     if 'objects' in gvadata and len(gvadata['objects']) > 0:
-      framewidth, frameheight = gvadata['resolution']['width'], gvadata['resolution']['height']
+      framewidth, frameheight = self.resolution
+      # local bindings for the per-detection loops
+      thresholds, default_threshold = self.confidence_thresholds, self._default_threshold
+      policy = self.metadatagenpolicy
+      detections = []
       for det in gvadata['objects']:
-        obj_type = det['detection']['label']
-        confidence = det['detection']['confidence']
-        threshold = self.get_threshold(obj_type)
-        if confidence < threshold:
+        detection = det['detection']
+        if detection['confidence'] < thresholds.get(detection['label'], default_threshold):
           continue  # Skip low-confidence detections everywhere
+        detections.append(det)
+      bboxes = computeObjBoundingBoxParams(detections, framewidth, frameheight)
+      for det, bbox in zip(detections, bboxes):
         vaobj = {}
-        self.metadatagenpolicy(vaobj, det, framewidth, frameheight)
+        policy(vaobj, det, framewidth, frameheight)
+        vaobj.update(bbox)
         otype = vaobj['category']
         vaobj['id'] = len(objects[otype]) + 1
         objects[otype].append(vaobj)
-    self.frame_level_data['objects'] = objects
-
-    # --- Only check for resolution if not already set ---
-    if self.resolution is None:
-      if 'resolution' in gvadata:
-        self.resolution = [gvadata['resolution']['width'], gvadata['resolution']['height']]
 
     # --- Update intrinsics if not set and resolution is available ---
     if self.intrinsics_obj is None and self.resolution is not None and self._calib_intrinsics is not None:
       self.intrinsics_obj = CameraIntrinsics(self._calib_intrinsics, self._calib_distortion, self.resolution)
       self.frame_level_data.update(self.intrinsics_obj.asDict())
+      # json-ready copies for buildImgData, converted once since the calibration is fixed
+      self._intrinsics_json = self.intrinsics_obj.intrinsics.tolist()
+      self._distortion_json = self.intrinsics_obj.asDict()['distortion']
 
   def processFrame(self, frame):
-    if self.client.is_connected():
+    if self._connected:
       gvametadata, imgdatadict = {}, {}
 
       utils.get_gva_meta_messages(frame, gvametadata)
       gvametadata['gva_meta'] = utils.get_gva_meta_regions(frame)
 
       self.buildObjData(gvametadata)
+      publish, dumps = self.client.publish, jsonDumps
 
+      # serialize all payloads up front so the publishes go out back to back
+      messages = []
+      imgpayload = None
       if self.is_publish_image:
         self.buildImgData(imgdatadict, frame, True)
-        self.client.publish(f"scenescape/image/camera/{self.cameraid}", json.dumps(imgdatadict))
+        imgpayload = dumpsImgData(imgdatadict)
+        messages.append((self.topic_image, imgpayload))
         self.is_publish_image = False
 
       if self.is_publish_calibration_image:
-        if not imgdatadict:
+        if imgpayload is None:
           self.buildImgData(imgdatadict, frame, False)
-        self.client.publish(f"scenescape/image/calibration/camera/{self.cameraid}", json.dumps(imgdatadict))
+          imgpayload = dumpsImgData(imgdatadict)
+        messages.append((self.topic_calibration_image, imgpayload))
         self.is_publish_calibration_image = False
 
-      self.client.publish(f"scenescape/data/camera/{self.cameraid}", json.dumps(self.frame_level_data))
-      frame.add_message(json.dumps(self.frame_level_data))
+      # serialize once and share between mqtt and the gva frame
+      payload = dumps(self.frame_level_data)
+
+      for topic, message in messages:
+        publish(topic, message, qos=0, retain=False)
+      publish(self.topic_data, payload, qos=0, retain=False)
+      frame.add_message(payload.decode('utf-8'))
     return True